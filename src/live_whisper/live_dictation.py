@@ -4,7 +4,7 @@ import sys
 import threading
 import time
 import wave
-from pprint import pprint
+from pprint import pformat
 
 import numpy as np
 import pyaudio
@@ -28,6 +28,54 @@ STOP_KEY = Key.esc  # Escape key to quit the script
 # **YOU MUST FIND THIS INDEX:** Run the discovery script below first.
 INPUT_DEVICE_INDEX = 3  # Your USB Condenser Microphone is at index 3
 
+# --- KEYWORD PUNCTUATION CONFIG ---
+# Order: longer phrases first to prevent partial matches
+PUNCTUATION_REPLACEMENTS = {
+    # Multi-word commands first
+    "question mark": "?",
+    "exclamation point": "!",
+    "new paragraph": "\n\n",
+    "new line": "\n",
+    "open quote": '"',
+    "close quote": '"',
+    "dollar sign": "$",
+    "open parenthesis": "(",
+    "close parenthesis": ")",
+    # Single-word commands
+    "period": ".",
+    "comma": ",",
+    "colon": ":",
+    "semicolon": ";",
+    "hashtag": "#",
+}
+
+# Keyword and whitespace-cleanup patterns used by process_text_with_llm.
+# All keywords share one case-insensitive, word-bounded alternation so the text
+# is scanned once; alternatives keep the longest-first order from above.
+# Each keyword gets its own named group so the replacement is looked up by
+# match.lastgroup, never by the matched text (IGNORECASE also matches Unicode
+# case variants such as "ſ" for "s" that do not lower() back to the key).
+_KEYWORD_GROUPS = {
+    f"kw{index}": punctuation
+    for index, punctuation in enumerate(PUNCTUATION_REPLACEMENTS.values())
+}
+_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        f"(?P<kw{index}>{re.escape(keyword)})"
+        for index, keyword in enumerate(PUNCTUATION_REPLACEMENTS)
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+_SPACE_BEFORE_TERMINAL_RE = re.compile(r"([^ ]) ([.,!?])")
+_SPACE_AFTER_COMMA_RE = re.compile(r"(,) ([^ \n])")
+_SPACE_BEFORE_COLON_RE = re.compile(r"([^ ]) ([;:])")
+_SPACE_BEFORE_DOLLAR_RE = re.compile(r"([^ ]) (\$)")
+_SPACES_INSIDE_QUOTES_RE = re.compile(r'" +([a-zA-Z0-9\'"]+) +"')
+_SPACES_INSIDE_PARENS_RE = re.compile(r"\( +([^)]+) +\)")
+_SPACES_AROUND_NEWLINE_RE = re.compile(r" *\n *")
+
 
 # --- GLOBAL STATE ---
 is_recording = False
@@ -101,10 +149,9 @@ def stop_recording_and_process():
         #     p.get_sample_size(FORMAT),
         #     RATE)
 
-        # 3. Convert buffer to numpy array for processing
-        audio_data = (
-            np.frombuffer(raw_audio_buffer, dtype=np.int16).astype(np.float32) / 32768.0
-        )
+        # 3. Convert buffer to numpy array for processing (normalize in place)
+        audio_data = np.frombuffer(raw_audio_buffer, dtype=np.int16).astype(np.float32)
+        audio_data /= 32768.0
 
         # 4. Resample for Whisper
         if RATE != 16000:
@@ -148,9 +195,13 @@ def transcribe_audio(audio_data):
     """Transcribes the given audio data using the loaded Whisper model."""
     print("Transcribing with Whisper...", flush=True)
     result = whisper_instance.transcribe(audio_data, fp16=False)
-    print("--- Full Whisper Response ---", flush=True)
-    pprint(result)
-    print("-----------------------------", flush=True)
+    # Format the full response up front so it is written to stdout in one call
+    response = [
+        "--- Full Whisper Response ---",
+        pformat(result),
+        "-----------------------------",
+    ]
+    print("\n".join(response), flush=True)
     return result
 
 
@@ -166,49 +217,25 @@ def process_text_with_llm(text):
         f"Processing text '{text}' with keyword punctuation replacement...", flush=True
     )
 
-    # Order: longer phrases first to prevent partial matches
-    replacements = {
-        # Multi-word commands first
-        "question mark": "?",
-        "exclamation point": "!",
-        "new paragraph": "\n\n",
-        "new line": "\n",
-        "open quote": '"',
-        "close quote": '"',
-        "dollar sign": "$",
-        "open parenthesis": "(",
-        "close parenthesis": ")",
-        # Single-word commands
-        "period": ".",
-        "comma": ",",
-        "colon": ":",
-        "semicolon": ";",
-        "hashtag": "#",
-    }
-
-    # Case-insensitive word boundary replacement
-    for keyword, punctuation in replacements.items():
-        pattern = r"\b" + re.escape(keyword) + r"\b"
-        text = re.sub(pattern, punctuation, text, flags=re.IGNORECASE)
+    text = _KEYWORD_RE.sub(lambda match: _KEYWORD_GROUPS[match.lastgroup], text)
 
     # Clean up spaces around punctuation and newlines (Apple dictation behavior)
     # Remove single space before terminal punctuation
     # (period, comma, question, exclamation)
     # Note: exclude quotes and parentheses as they need special handling
-    text = re.sub(r"([^ ]) ([.,!?])", r"\1\2", text)
+    text = _SPACE_BEFORE_TERMINAL_RE.sub(r"\1\2", text)
     # Remove single space after comma when between words (preserve multiple spaces)
-    text = re.sub(r"(,) ([^ \n])", r"\1\2", text)
+    text = _SPACE_AFTER_COMMA_RE.sub(r"\1\2", text)
     # Colon and semicolon should keep space after
-    text = re.sub(r"([^ ]) ([;:])", r"\1\2", text)
+    text = _SPACE_BEFORE_COLON_RE.sub(r"\1\2", text)
     # Dollar sign and other symbols - remove space before but keep after
-    text = re.sub(r"([^ ]) (\$)", r"\1\2", text)
+    text = _SPACE_BEFORE_DOLLAR_RE.sub(r"\1\2", text)
     # Remove spaces inside quotes and parentheses
     # Match content between quotes/parens and remove surrounding spaces
-    text = re.sub(r'" +([a-zA-Z0-9\'"]+) +"', r'"\1"', text)  # Spaces inside quotes
-    text = re.sub(r"\( +([^)]+) +\)", r"(\1)", text)  # Spaces inside parentheses
+    text = _SPACES_INSIDE_QUOTES_RE.sub(r'"\1"', text)  # Spaces inside quotes
+    text = _SPACES_INSIDE_PARENS_RE.sub(r"(\1)", text)  # Spaces inside parentheses
     # Remove spaces around newlines
-    text = re.sub(r" *\n", "\n", text)
-    text = re.sub(r"\n *", "\n", text)
+    text = _SPACES_AROUND_NEWLINE_RE.sub("\n", text)
 
     return text
 
@@ -288,27 +315,22 @@ def main():
         sys.exit(1)
 
     # 2. Start the Listener Loop
-    print("-" * 40, flush=True)
-    print("Dictation Ready. Press and HOLD **Right Control** to record.", flush=True)
-    print("Release Right Control to transcribe and type.", flush=True)
-    print("Press **ESCAPE** to quit.", flush=True)
-    print("-" * 40, flush=True)
-
     # The main logic is wrapped in a try block to ensure cleanup happens
     try:
         # --- INTERACTIVE MODE ---
-        print("-" * 40, flush=True)
-        print(
-            "Dictation Ready. Press and HOLD **Right Control** to record.", flush=True
-        )
-        print("Release Right Control to transcribe and type.", flush=True)
-        print("Press **ESCAPE** to quit.", flush=True)
+        # Build the banner up front and emit it with a single write
+        banner = [
+            "-" * 40,
+            "Dictation Ready. Press and HOLD **Right Control** to record.",
+            "Release Right Control to transcribe and type.",
+            "Press **ESCAPE** to quit.",
+        ]
         if args.timeout:
-            print(
-                f"Script will automatically exit after {args.timeout} seconds.",
-                flush=True,
+            banner.append(
+                f"Script will automatically exit after {args.timeout} seconds."
             )
-        print("-" * 40, flush=True)
+        banner.append("-" * 40)
+        print("\n".join(banner), flush=True)
 
         with Listener(on_press=on_press, on_release=on_release) as listener:
             # If a timeout is set, start a timer to stop the listener
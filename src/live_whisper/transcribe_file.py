@@ -62,7 +62,7 @@ def main():
             audio_data /= max_val
 
         # Ensure data is in the range [-1.0, 1.0]
-        audio_data = np.clip(audio_data, -1.0, 1.0)
+        np.clip(audio_data, -1.0, 1.0, out=audio_data)
 
         # 4. Resample to 16kHz if necessary
         if samplerate != 16000:
@@ -71,7 +71,7 @@ def main():
             audio_data = resample(audio_data, num_samples)
 
             # Re-clamp after resampling, as it can introduce values outside the range
-            audio_data = np.clip(audio_data, -1.0, 1.0)
+            np.clip(audio_data, -1.0, 1.0, out=audio_data)
             print(
                 f"Resampling complete. Final sample count: {len(audio_data)}",
                 file=sys.stderr,
@@ -93,6 +93,17 @@ class TestKeywordReplacement(unittest.TestCase):
             process_text_with_llm("Item one semicolon item two"), "Item one; item two"
         )
 
+    def test_unicode_case_variants(self):
+        # IGNORECASE matches "ſ" (long s) and "ı" (dotless i) as "s" and "i"
+        self.assertEqual(process_text_with_llm("queſtion mark"), "?")
+        self.assertEqual(process_text_with_llm("ſemicolon"), ";")
+        self.assertEqual(process_text_with_llm("Cost dollar sıgn"), "Cost$")
+
+    def test_semicolon_next_to_colon(self):
+        # "colon" must not match inside "semicolon"; only the first space closes
+        self.assertEqual(process_text_with_llm("a semicolon colon b"), "a; : b")
+        self.assertEqual(process_text_with_llm("a colon semicolon b"), "a: ; b")
+
     def test_new_line_command(self):
         input_text = "Line one new line Line two"
         expected = "Line one\nLine two"